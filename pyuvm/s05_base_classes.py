@@ -13,6 +13,10 @@ from pyuvm.s08_factory_classes import uvm_factory
 class uvm_object(utility_classes.uvm_void):
     """The most basic UVM object"""
 
+    # Named fields live in slots. __dict__ is kept so that subclasses
+    # and users can still add attributes to any uvm_object.
+    __slots__ = ("_obj_name", "__dict__", "__weakref__")
+
     # 5.3.2
     def __init__(self, name=""):
         """
@@ -359,6 +363,14 @@ class uvm_transaction(uvm_object):
     Transactions without interface to logging or waveforms.
     """
 
+    __slots__ = (
+        "_initiator",
+        "transaction_id",
+        "_accept_time",
+        "_begin_time",
+        "_end_time",
+    )
+
     # 5.4.2.1
     def __init__(self, name="", initiator=None):
         """
@@ -6,7 +6,9 @@
 # Python using Python features instead of emulating
 # SystemVerilog features.
 
+import collections
 
+from cocotb.queue import QueueEmpty
 from cocotb.triggers import Event as CocotbEvent
 
 from pyuvm.error_classes import *
@@ -99,24 +101,62 @@ class ResponseQueue(UVMQueue):
     """
     The ``ResponseQueue`` is a queue that can cherry-pick an item
     using an id number, or simply return the next item in the queue.
+
+    Items are indexed by ``transaction_id`` as they are put so that
+    ``get_response()`` finds its item without scanning the queue.
     """
 
     def __init__(self, maxsize: int = 0):
         super().__init__(maxsize=maxsize)
-        self.put_event = CocotbEvent()
+        self._by_id = {}
+        self._id_events = {}
+        self._dead = {}
+        self._n_dead = 0
 
-    def put_nowait(self, item):
+    def qsize(self) -> int:
+        return len(self._queue) - self._n_dead
+
+    def empty(self) -> bool:
+        return self.qsize() == 0
+
+    def _put(self, item):
         """
-        Extend the ``cocotb.queue.Queue.put_nowait`` method to set the
-        ``put_event`` flag.  This flag is used to signal that an item has
-        been put in the queue so that get_response can be unblocked.
+        Extend the ``cocotb.queue.Queue._put`` method to index the item
+        by its ``transaction_id`` and wake any ``get_response()`` waiting
+        on that id.
 
         :param item: The item to put in the queue
-        :raises QueueFull: If the queue is full
         """
-        super().put_nowait(item)
-        self.put_event.set()
-        self.put_event.clear()
+        super()._put(item)
+        txn_id = item.transaction_id
+        self._by_id.setdefault(txn_id, collections.deque()).append(item)
+        event = self._id_events.pop(txn_id, None)
+        if event is not None:
+            event.set()
+
+    def _get(self):
+        item = self._queue.popleft()
+        self._unindex(item.transaction_id)
+        self._drop_dead()
+        return item
+
+    def _unindex(self, txn_id):
+        items = self._by_id[txn_id]
+        item = items.popleft()
+        if not items:
+            del self._by_id[txn_id]
+        return item
+
+    def _drop_dead(self):
+        # Items taken by get_response() stay in the deque as tombstones
+        # until they reach the head, so the head is always a live item.
+        while self._n_dead and id(self._queue[0]) in self._dead:
+            key = id(self._queue.popleft())
+            self._n_dead -= 1
+            if self._dead[key] == 1:
+                del self._dead[key]
+            else:
+                self._dead[key] -= 1
 
     async def get_response(self, txn_id=None):
         """
@@ -130,19 +170,118 @@ class ResponseQueue(UVMQueue):
         """
         if txn_id is None:
             return await self.get()
+        while txn_id not in self._by_id:
+            event = self._id_events.get(txn_id)
+            if event is None:
+                event = self._id_events[txn_id] = CocotbEvent()
+            await event.wait()
+        item = self._unindex(txn_id)
+        if item is self._queue[0]:
+            self._queue.popleft()
+            self._drop_dead()
+        else:
+            key = id(item)
+            self._dead[key] = self._dead.get(key, 0) + 1
+            self._n_dead += 1
+        self._wakeup_next(self._putters)
+        return item
+
+    def __str__(self):
+        dead = dict(self._dead)
+        live = []
+        for xx in self._queue:
+            if dead.get(id(xx)):
+                dead[id(xx)] -= 1
+            else:
+                live.append(str(xx))
+        return str(live)
+
+
+class _ItemHandoff:
+    """
+    Passes a one-time signal about a particular item from one
+    coroutine to the one waiting for it. A signal sent before the
+    waiter arrives is remembered, and an event is only needed
+    when the waiter has to block. Each event is set once, like a
+    future, and is recycled once its waiter has resumed.
+    """
+
+    _SIGNALED = object()
+
+    def __init__(self):
+        self._pending = {}
+        self._free_events = []
+
+    def set(self, item):
+        event = self._pending.pop(id(item), None)
+        if event is None or event is self._SIGNALED:
+            self._pending[id(item)] = self._SIGNALED
+        else:
+            event.set()
+
+    async def wait(self, item):
+        key = id(item)
+        if self._pending.get(key) is self._SIGNALED:
+            del self._pending[key]
+            return
+        if self._free_events:
+            event = self._free_events.pop()
         else:
-            while True:
-                item_list = list(self._queue)
-                txn_list = [xx for xx in item_list if xx.transaction_id == txn_id]
-                if len(txn_list) == 0:
-                    await self.put_event.wait()
-                else:
-                    assert len(txn_list) == 1, (
-                        f"Multiple transactionsn have the same ID: {txn_id}"
-                    )
-                    _ = self._queue.index(txn_list[0])
-                    self._queue.remove(txn_list[0])
-                    return txn_list[0]
+            event = CocotbEvent()
+        self._pending[key] = event
+        await event.wait()
+        event.clear()
+        self._free_events.append(event)
+
+
+class _SingleConsumerQueue:
+    """
+    An unbounded queue for the request path from the sequences to the
+    driver. Any number of sequences may put, but only the driver gets,
+    so a single event is enough to wake the consumer and no per-get
+    trigger is allocated.
+
+    ``put()`` returns once the consumer has taken the item, so the
+    get is the signal that the item has started. ``put_nowait()``
+    does not wait.
+    """
+
+    def __init__(self):
+        self._queue = collections.deque()
+        self._put_event = CocotbEvent()
+        self._taken = _ItemHandoff()
+
+    def qsize(self):
+        return len(self._queue)
+
+    def empty(self):
+        return not self._queue
+
+    def put_nowait(self, item):
+        self._queue.append(item)
+        self._put_event.set()
+
+    async def put(self, item):
+        self.put_nowait(item)
+        await self._taken.wait(item)
+
+    def _take(self):
+        item = self._queue.popleft()
+        # Only wake a put() that is waiting on this item
+        if id(item) in self._taken._pending:
+            self._taken.set(item)
+        return item
+
+    def get_nowait(self):
+        if not self._queue:
+            raise QueueEmpty()
+        return self._take()
+
+    async def get(self):
+        while not self._queue:
+            self._put_event.clear()
+            await self._put_event.wait()
+        return self._take()
 
     def __str__(self):
         return str([str(xx) for xx in self._queue])
@@ -150,15 +289,63 @@ class ResponseQueue(UVMQueue):
 
 class uvm_sequence_item(uvm_transaction):
     """
-    The pyuvm uvm_sequence_item has events to
-    implement start_item() and finish_item()
+    The pyuvm uvm_sequence_item carries the ids that link
+    a response to its request. The start_item() and
+    finish_item() handshake lives in the uvm_seq_item_export.
     """
 
+    __slots__ = ("parent_sequence_id", "response_id")
+
+    # Free lists of released items, keyed on class
+    _pools = {}
+
     def __init__(self, name):
         super().__init__(name)
-        self.start_condition = CocotbEvent()
-        self.finish_condition = CocotbEvent()
-        self.item_ready = CocotbEvent()
+        self.parent_sequence_id = None
+        self.response_id = None
+
+    @classmethod
+    def acquire(cls, name):
+        """
+        Get an item of this class from its free list, or construct a new
+        one if the free list is empty. A recycled item is reset with
+        ``_reset()``, so subclasses that add fields should extend
+        ``_reset()`` to clear them.
+
+        :param name: The name of the item
+        :return: An item of this class
+        """
+        pool = uvm_sequence_item._pools.get(cls)
+        if pool:
+            item = pool.pop()
+            item._reset(name)
+            return item
+        return cls(name)
+
+    def release(self):
+        """
+        Return this item to its class's free list so that ``acquire()``
+        can reuse it. Only release an item once its ``item_done()`` has
+        been called and nothing holds a handle to it. References the item
+        holds are dropped here so the free list does not keep them alive.
+        """
+        self.set_initiator(None)
+        uvm_sequence_item._pools.setdefault(type(self), collections.deque()).append(
+            self
+        )
+
+    def _reset(self, name):
+        """
+        Restore a released item to its just-constructed state.
+
+        :param name: The new name of the item
+        """
+        self.set_name(name)
+        self.set_initiator(None)
+        self.transaction_id = id(self)
+        self._accept_time = None
+        self._begin_time = None
+        self._end_time = None
         self.parent_sequence_id = None
         self.response_id = None
 
@@ -167,10 +354,16 @@ class uvm_sequence_item(uvm_transaction):
         Use this to link a new response transaction to the request transaction.
         rsp.set_context(req)
 
+        The ``response_id`` is a single int with the parent sequence id
+        in the bits above the request's transaction id. Both are ``id()``
+        values, which fit in 64 bits.
+
         :param item: The request transaction
         :return: None
         """
-        self.response_id = (item.parent_sequence_id, item.get_transaction_id())
+        self.response_id = ((item.parent_sequence_id or 0) << 64) | (
+            item.get_transaction_id()
+        )
 
 
 class uvm_seq_item_export(uvm_blocking_put_export):
@@ -181,18 +374,26 @@ class uvm_seq_item_export(uvm_blocking_put_export):
 
     def __init__(self, name, parent):
         super().__init__(name, parent)
-        self.req_q = UVMQueue()
+        self.req_q = _SingleConsumerQueue()
         self.rsp_q = ResponseQueue()
         self.current_item = None
+        # Items given to the driver that are waiting for item_done()
+        self._in_progress = collections.deque()
+        # The finish_item() handshake, shared by all items. start_item()
+        # needs no signal of its own: req_q.put() returns once the
+        # driver has taken the item.
+        self.item_ready = _ItemHandoff()
+        self.finish_condition = _ItemHandoff()
 
     async def put_req(self, item):
         """
-        put request into request queue. Block if the queue is full.
+        put request into request queue. The queue is unbounded
+        so this does not block.
 
         :param item: request item
         :return: None
         """
-        await self.req_q.put(item)
+        self.req_q.put_nowait(item)
 
     def put_response(self, item):
         """
@@ -217,15 +418,41 @@ class uvm_seq_item_export(uvm_blocking_put_export):
                 "You must call item_done() before calling get_next_item again"
             )
         self.current_item = await self.req_q.get()
-        self.current_item.start_condition.set()
-        self.current_item.start_condition.clear()
-        await self.current_item.item_ready.wait()
+        self._in_progress.append(self.current_item)
+        await self.item_ready.wait(self.current_item)
         return self.current_item
 
+    async def get_next_items(self, n=16):
+        """
+        A coroutine that blocks until at least one item is available
+        and then takes up to ``n`` items that are already in the queue.
+        This lets a pipelining driver start several transactions
+        from a single wakeup. Returns once every item has been through
+        ``finish_item()``. Call ``item_done()`` once per item, in the
+        order the items were returned.
+
+        :param n: The maximum number of items to return
+        :return: list of items to process
+
+        """
+        if self.current_item is not None:
+            raise error_classes.UVMSequenceError(
+                "You must call item_done() before calling get_next_items again"
+            )
+        items = [await self.req_q.get()]
+        while len(items) < n and not self.req_q.empty():
+            items.append(self.req_q.get_nowait())
+        self._in_progress.extend(items)
+        self.current_item = items[0]
+        for item in items:
+            await self.item_ready.wait(item)
+        return items
+
     def item_done(self, rsp=None):
         """
         Signal that the item has been completed. If ``rsp`` is not ``None``
-        put it into the response queue.
+        put it into the response queue. After ``get_next_items()`` this
+        completes the oldest item that is still in progress.
 
         :param rsp: (optional) item to put in response queue if not None
         """
@@ -233,9 +460,8 @@ class uvm_seq_item_export(uvm_blocking_put_export):
             raise error_classes.UVMSequenceError(
                 "You must call get_next_item before calling item_done"
             )
-        self.current_item.finish_condition.set()
-        self.current_item.finish_condition.clear()
-        self.current_item = None
+        self.finish_condition.set(self._in_progress.popleft())
+        self.current_item = self._in_progress[0] if self._in_progress else None
         if rsp is not None:
             self.put_response(rsp)
 
@@ -255,9 +481,35 @@ class uvm_seq_item_export(uvm_blocking_put_export):
 
 
 class uvm_seq_item_port(uvm_port_base):
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        # Stand-ins for the export's methods until connect() binds them
+        self._put_req = self._not_connected
+        self._put_response = self._not_connected
+        self._get_next_item = self._not_connected
+        self._item_done = self._not_connected
+        self._get_response = self._not_connected
+
+    def _not_connected(self, *args):
+        raise UVMTLMConnectionError(f"{self.get_full_name()} export is not connected")
+
     def connect(self, export):
         self._check_export(export)
         super().connect(export)
+        # Bind the methods _check_export() guarantees once rather than
+        # on every call
+        self._put_req = export.put_req
+        self._put_response = export.put_response
+        self._get_next_item = export.get_next_item
+        self._item_done = export.item_done
+        self._get_response = export.get_response
+        # Bind put_response_fast() directly to the response queue when
+        # the target is the export itself. A port or custom export only
+        # promises put_response().
+        if isinstance(export, uvm_seq_item_export):
+            self.put_response_fast = export.rsp_q.put_nowait
+        else:
+            self.put_response_fast = export.put_response
 
     async def put_req(self, item):
         """
@@ -266,7 +518,7 @@ class uvm_seq_item_port(uvm_port_base):
         :param item: The request item
 
         """
-        await self.export.put_req(item)
+        await self._put_req(item)
 
     def put_response(self, item):
         """
@@ -274,16 +526,27 @@ class uvm_seq_item_port(uvm_port_base):
 
         :param item: The response item
         :Raises UVMFatalError: If the item is not a subclass of
-        uvm_sequence_item
+        uvm_sequence_item. The check is skipped under python -O.
         """
-
-        try:
-            assert issubclass(type(item), uvm_sequence_item)
-        except AssertionError:
+        if __debug__ and not isinstance(item, uvm_sequence_item):
             raise UVMFatalError(
                 "put_response only takes uvm_sequence_items as arguments"
             )
-        self.export.put_response(item)
+        self._put_response(item)
+
+    def put_response_fast(self, item):
+        """
+        Put a response straight into the export's response queue.
+        Unlike ``put_response()`` there is no type check and no call
+        through the export, so use it only in driver loops that
+        always send uvm_sequence_items. When the port is connected
+        to a ``uvm_seq_item_export`` this name is the response queue's
+        ``put_nowait()``, otherwise it is the target's ``put_response()``.
+
+        :param item: The response item
+        :raise QueueFull: If the queue is full
+        """
+        self._put_response(item)
 
     async def get_next_item(self):
         """
@@ -293,11 +556,21 @@ class uvm_seq_item_port(uvm_port_base):
         :return: The next sequence item
 
         """
-        try:
-            return await self.export.get_next_item()
-        except AttributeError:
-            assert self.export is not None, "export is not connected"
-            raise
+        return await self._get_next_item()
+
+    async def get_next_items(self, n=16):
+        """
+        A coroutine that gets up to ``n`` sequence items that are ready in
+        the request queue, blocking until there is at least one.
+
+        :param n: The maximum number of items to return
+        :return: list of sequence items
+        :raise UVMTLMConnectionError: If the port is not connected
+
+        """
+        if self.export is None:
+            self._not_connected()
+        return await self.export.get_next_items(n)
 
     def item_done(self, rsp=None):
         """
@@ -305,17 +578,13 @@ class uvm_seq_item_port(uvm_port_base):
         ``rsp`` is not ``None``, put it in the response queue.
 
         :param rsp: (optional) The response item
-        :raise UVMFatalError: If ``rsp`` is not a subclass of uvm_sequence_item
+        :raise UVMFatalError: If ``rsp`` is not a subclass of uvm_sequence_item.
+            The check is skipped under python -O.
 
         """
-        if rsp is not None:
-            try:
-                assert issubclass(type(rsp), uvm_sequence_item)
-            except AssertionError:
-                raise UVMFatalError(
-                    "item_done only takes uvm_sequence_items as arguments"
-                )
-        self.export.item_done(rsp)
+        if __debug__ and rsp is not None and not isinstance(rsp, uvm_sequence_item):
+            raise UVMFatalError("item_done only takes uvm_sequence_items as arguments")
+        self._item_done(rsp)
 
     async def get_response(self, transaction_id=None):
         """
@@ -328,8 +597,7 @@ class uvm_seq_item_port(uvm_port_base):
         :return: The response item
 
         """
-        datum = await self.export.get_response(transaction_id)
-        return datum
+        return await self._get_response(transaction_id)
 
 
 # The UVM sequencer is really just a holder for the
@@ -348,21 +616,13 @@ class uvm_sequencer(uvm_component):
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.seq_item_export = uvm_seq_item_export("seq_item_export", self)
-        self.seq_q = UVMQueue(0)
-
-    async def run_phase(self):
-        while True:
-            next_item = await self.seq_q.get()
-            await self.seq_item_export.put_req(next_item)
 
     async def start_item(self, item):
-        await self.seq_q.put(item)
-        await item.start_condition.wait()
+        await self.seq_item_export.req_q.put(item)
 
     async def finish_item(self, item):
-        item.item_ready.set()
-        item.item_ready.clear()
-        await item.finish_condition.wait()
+        self.seq_item_export.item_ready.set(item)
+        await self.seq_item_export.finish_condition.wait(item)
 
     async def put_req(self, req):
         await self.seq_item_export.put_req(req)
@@ -385,12 +645,44 @@ class uvm_sequence(uvm_object):
     body() gets launched in a thread at start.
     """
 
+    __slots__ = (
+        "_sequencer",
+        "_start_item",
+        "_export",
+        "_get_response",
+        "running_item",
+        "sequence_id",
+    )
+
     def __init__(self, name="uvm_sequence"):
         super().__init__(name)
         self.sequencer = None
         self.running_item = None
         self.sequence_id = id(self)
 
+    @property
+    def sequencer(self):
+        """
+        The sequencer this sequence runs on, or ``None`` for a
+        virtual sequence.
+        """
+        return self._sequencer
+
+    @sequencer.setter
+    def sequencer(self, seqr):
+        self._sequencer = seqr
+        # Cached so start_item(), finish_item() and get_response() skip
+        # the attribute lookups, and the last two go straight to the
+        # export rather than through the sequencer
+        if seqr is None:
+            self._start_item = None
+            self._export = None
+            self._get_response = None
+        else:
+            self._start_item = seqr.start_item
+            self._export = seqr.seq_item_export
+            self._get_response = self._export.rsp_q.get_response
+
     async def pre_body(self):
         """
         This function gets launced BEFORE the function body() is started
@@ -441,31 +733,29 @@ class uvm_sequence(uvm_object):
 
         :param item: The sequence item to send to the driver.
         """
-        if self.sequencer is None:
+        if self._sequencer is None:
             raise error_classes.UVMSequenceError(
                 f"Tried start_item in a virtual sequence {self.get_full_name()}"
             )
         item.parent_sequence_id = self.sequence_id
         self.running_item = item
-        await self.sequencer.start_item(item)
+        await self._start_item(item)
 
     async def finish_item(self, item):
-        if self.sequencer is None:
+        if self._sequencer is None:
             raise error_classes.UVMSequenceError(
                 f"Tried finish_item in virtual sequence: {self.get_full_name()}"
             )
-        await self.sequencer.finish_item(item)
+        export = self._export
+        export.item_ready.set(item)
+        await export.finish_condition.wait(item)
 
     async def get_response(self, transaction_id=None):
-        if self.sequencer is None:
+        if self._sequencer is None:
             raise error_classes.UVMSequenceError(
                 "Tried to do get_response in a virtual "
                 f"sequence: {self.get_full_name()}"
             )
-        tran_id = (
-            transaction_id
-            if transaction_id is not None
-            else self.running_item.transaction_id
-        )
-        datum = await self.sequencer.get_response(tran_id)
-        return datum
+        if transaction_id is None:
+            transaction_id = self.running_item.transaction_id
+        return await self._get_response(transaction_id)
@@ -303,7 +303,7 @@ class uvm_reg_map(uvm_object):
         local_adapter = self.get_adapter()
         # Build a local reg_item
         # TODO: this should come as input of the main process operation
-        item = uvm_reg_item()
+        item = uvm_reg_item.acquire("item")
         item.set_kind(access_e.UVM_WRITE)
         item.set_value(data_to_be_written)
         item.set_door(path)
@@ -331,6 +331,7 @@ class uvm_reg_map(uvm_object):
             local_adapter.set_item(item)
             bus_req = local_adapter.reg2bus(local_bus_op)
             local_adapter.set_item(None)
+            item.release()
             # Get the sequence and start
             local_sequence = local_adapter.get_parent_sequence()
             # set the sequencer to the local sequence
@@ -358,7 +359,7 @@ class uvm_reg_map(uvm_object):
         local_adapter = self.get_adapter()
         # Build a local reg_item
         # TODO: this should come as input of the main process operation
-        item = uvm_reg_item()
+        item = uvm_reg_item.acquire("item")
         item.set_kind(access_e.UVM_WRITE)
         item.set_door(path)
         item.set_map(self)
@@ -384,6 +385,7 @@ class uvm_reg_map(uvm_object):
             local_adapter.set_item(item)
             bus_req = local_adapter.reg2bus(local_bus_op)
             local_adapter.set_item(None)
+            item.release()
             # Get the sequence and start
             local_sequence = local_adapter.get_parent_sequence()
             # set the sequencer to the local sequence
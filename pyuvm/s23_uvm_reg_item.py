@@ -1,5 +1,5 @@
 # Import Main Package
-from copy import deepcopy
+from array import array
 
 from pyuvm.s05_base_classes import uvm_object
 from pyuvm.s14_15_python_sequences import uvm_sequence_item
@@ -9,6 +9,29 @@ from pyuvm.s24_uvm_reg_includes import access_e, elem_kind_e, error_out, path_t
 
 # Main Class
 class uvm_reg_item(uvm_sequence_item):
+    __slots__ = (
+        "element_kind",
+        "element_object",
+        "element",
+        "kind",
+        "value",
+        "offset",
+        "status",
+        "local_map",
+        "path",
+        "parent_sequence",
+        "extension_object",
+        "extension",
+        "bd_kind",
+        "name",
+        "addr",
+        "data",
+        "n_bits",
+        "header",
+        "fname",
+        "lineno",
+    )
+
     # constructor
     def __init__(self, name="item"):
         # Kind of element being accessed: REG, MEM, or FIELD.
@@ -22,8 +45,10 @@ class uvm_reg_item(uvm_sequence_item):
         # with it shall be via the set_kind() and get_kind() accessor methods
         self.kind: access_e
         # The value to write to, or after completion,
-        # the value read from the DUT.
-        self.value = []
+        # the value read from the DUT. Held as unsigned 64 bit
+        # words while every value fits, and as a list otherwise
+        # since uvm_reg_data_t is an unbounded int.
+        self.value = array("Q")
         # For memory accesses, the offset address. For bursts,
         # the ~starting~ offset address.
         # Access to this variable is provided
@@ -67,7 +92,50 @@ class uvm_reg_item(uvm_sequence_item):
     # Internal Methods
     ########################################################
 
+    # _reset
+    # Called by acquire() when an item is reused from the free list.
+    # The value array is emptied in place rather than reallocated.
+    def _reset(self, name):
+        super()._reset(name)
+        for attr in ("element_kind", "element", "kind", "path", "extension"):
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self.element_object = None
+        if type(self.value) is array:
+            del self.value[:]
+        else:
+            self.value = array("Q")
+        self.offset = 0
+        self.status = uvm_status_e.UVM_IS_OK
+        self.local_map = None
+        self.parent_sequence = None
+        self.extension_object = None
+        self.bd_kind = "RTL"
+        self.name = name
+        self.addr = 0
+        self.data = 0
+        self.n_bits = 0
+        self.fname = ""
+        self.lineno = 0
+
+    # release
+    # Drop the handles to the model, map, sequence and extension so
+    # a released item on the free list does not keep them alive
+    def release(self):
+        for attr in ("element", "extension"):
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self.element_object = None
+        self.local_map = None
+        self.parent_sequence = None
+        self.extension_object = None
+        super().release()
+
     # do_copy
+    # Shallow copy of every slot set on rhs, along the whole class
+    # hierarchy, and of the instance __dict__, into a new item of rhs's
+    # class. Handles to the element, map, sequence and extension are
+    # shared with rhs. The value container is duplicated.
     def do_copy(self, rhs):
         # Check
         if not isinstance(rhs, uvm_reg_item):
@@ -76,9 +144,18 @@ class uvm_reg_item(uvm_sequence_item):
                 "WRONG_TYPE Provided rhs \
                       is not of type uvm_reg_item",
             )
-        else:
-            # Deep Copy
-            copied = deepcopy(rhs)
+            return None
+        cls = type(rhs)
+        copied = cls.__new__(cls)
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            for attr in slots:
+                if attr not in ("__dict__", "__weakref__") and hasattr(rhs, attr):
+                    setattr(copied, attr, getattr(rhs, attr))
+        copied.__dict__.update(rhs.__dict__)
+        copied.value = rhs.value[:]
         return copied
 
     # set_element_kind
@@ -106,10 +183,16 @@ class uvm_reg_item(uvm_sequence_item):
         return self.kind
 
     # set_value
+    # Switches the value to a list when value does not fit in an
+    # unsigned 64 bit word
     def set_value(self, value, idx=0):
         if idx >= len(self.value):
-            self.value += [0] * (idx - len(self.value) + 1)
-        self.value[idx] = value
+            self.value.extend([0] * (idx - len(self.value) + 1))
+        try:
+            self.value[idx] = value
+        except (OverflowError, TypeError):
+            self.value = self.value.tolist()
+            self.value[idx] = value
 
     # get_value
     def get_value(self, idx=0):
@@ -120,15 +203,20 @@ class uvm_reg_item(uvm_sequence_item):
 
     # set_value_size
     def set_value_size(self, sz):
-        self.value = [0] * sz
+        self.value = array("Q", bytes(8 * sz))
 
     # get_value_size
     def get_value_size(self):
         return len(self.value)
 
     # set_value_array
+    # Values that fit are copied into an unsigned 64 bit array,
+    # otherwise v itself is held
     def set_value_array(self, v):
-        self.value = v
+        try:
+            self.value = array("Q", v)
+        except (OverflowError, TypeError):
+            self.value = v
 
     # get_value_array
     def get_value_array(self):
@@ -143,8 +231,9 @@ class uvm_reg_item(uvm_sequence_item):
         return self.offset
 
     # set_status
+    # The type checks in the setters are skipped under python -O
     def set_status(self, status):
-        if not isinstance(status, uvm_status_e):
+        if __debug__ and not isinstance(status, uvm_status_e):
             error_out(self.header, "Wrong assignment to status Enum")
         else:
             self.status = status
@@ -172,7 +261,7 @@ class uvm_reg_item(uvm_sequence_item):
 
     # set_extension
     def set_extension(self, ext):
-        if not isinstance(ext, uvm_object):
+        if __debug__ and not isinstance(ext, uvm_object):
             error_out(
                 self.header,
                 "bd kind is not string possible values \
@@ -187,7 +276,7 @@ class uvm_reg_item(uvm_sequence_item):
 
     # set_bd_kind
     def set_bd_kind(self, val):
-        if not isinstance(val, str):
+        if __debug__ and not isinstance(val, str):
             error_out(
                 self.header,
                 "bd kind is not string possible values \
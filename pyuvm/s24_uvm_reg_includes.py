@@ -96,7 +96,7 @@ def rand_enable(use_pyvsc: bool):
 
         # operate on CLS init inupt argument
         def __call__(self):
-            if use_pyvsc is True:
+            if use_pyvsc:
                 raise UVMNotImplemented()
             else:
                 # Return the function unchanged, not decorated. if use_pyvsc
@@ -199,6 +199,8 @@ class uvm_void(metaclass=FactoryMeta):
     that all UVM classes can be stored in a factory.
     """
 
+    __slots__ = ()
+
 
 class UVM_ROOT_Singleton(FactoryMeta):
     singleton = None
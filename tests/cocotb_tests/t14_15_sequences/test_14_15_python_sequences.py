@@ -136,6 +136,62 @@ class py1415_sequence_TestCase(uvm_unittest.uvm_TestCase):
             print("ERROR: ", ae)
             raise
 
+    async def test_ResponseQueue_mixed_get(self):
+        rq = ResponseQueue()
+        for ii in range(5):
+            rq.put_nowait(self.ItemClass(txn_id=ii))
+        self.assertEqual(3, (await rq.get_response(3)).transaction_id)
+        self.assertEqual(1, (await rq.get_response(1)).transaction_id)
+        self.assertEqual(3, rq.qsize())
+        result = [(await rq.get()).transaction_id for _ in range(3)]
+        self.assertEqual([0, 2, 4], result)
+        self.assertTrue(rq.empty())
+
+    async def test_ResponseQueue_unrelated_puts(self):
+        rq = ResponseQueue()
+        cocotb.start_soon(self.response_getter(rq.get_response, [7]))
+        for ii in range(3):
+            rq.put_nowait(self.ItemClass(txn_id=ii))
+            await cocotb.triggers.Timer(1)
+        self.assertEqual([], self.result_list)
+        rq.put_nowait(self.ItemClass(txn_id=7))
+        await cocotb.triggers.Timer(1)
+        self.assertEqual([7], [xx.transaction_id for xx in self.result_list])
+        self.assertEqual(3, rq.qsize())
+
+    async def test_set_context(self):
+        req_a = uvm_sequence_item("req_a")
+        req_b = uvm_sequence_item("req_b")
+        req_a.parent_sequence_id = req_b.parent_sequence_id = 2**40 + 1
+        rsp_a = uvm_sequence_item("rsp_a")
+        rsp_b = uvm_sequence_item("rsp_b")
+        rsp_a.set_context(req_a)
+        rsp_b.set_context(req_b)
+        self.assertIsInstance(rsp_a.response_id, int)
+        self.assertNotEqual(rsp_a.response_id, rsp_b.response_id)
+        self.assertEqual(req_a.transaction_id, rsp_a.response_id & (2**64 - 1))
+        self.assertEqual(2**40 + 1, rsp_a.response_id >> 64)
+
+    async def test_sequence_item_acquire_release(self):
+        class PoolItem(uvm_sequence_item):
+            pass
+
+        item = PoolItem.acquire("first")
+        item.set_initiator(self.my_root)
+        item.parent_sequence_id = 1
+        item.response_id = 2
+        item.transaction_id = 3
+        item.release()
+        self.assertIsNone(item.get_initiator())
+        reused = PoolItem.acquire("second")
+        self.assertIs(item, reused)
+        self.assertEqual("second", reused.get_name())
+        self.assertEqual(id(reused), reused.transaction_id)
+        self.assertIsNone(reused.get_initiator())
+        self.assertIsNone(reused.parent_sequence_id)
+        self.assertIsNone(reused.response_id)
+        self.assertIsNot(reused, PoolItem.acquire("third"))
+
     async def test_uvm_item_export_check(self):
         sip = uvm_seq_item_port("sip", self.my_root)
         bpe = uvm_blocking_put_export("bpe", self.my_root)
@@ -148,6 +204,50 @@ class py1415_sequence_TestCase(uvm_unittest.uvm_TestCase):
         sip.connect(sie)
         await self.run_get_response(sip.put_response, sip.get_response)
 
+    async def test_uvm_item_port_put_response_fast(self):
+        sip = uvm_seq_item_port("sip", self.my_root)
+        sie = uvm_seq_item_export("sie", self.my_root)
+        sip.connect(sie)
+        await self.run_get_response(sip.put_response_fast, sip.get_response)
+
+    async def test_uvm_item_port_to_port(self):
+        sip = uvm_seq_item_port("sip", self.my_root)
+        parent_sip = uvm_seq_item_port("parent_sip", self.my_root)
+        sie = uvm_seq_item_export("sie", self.my_root)
+        sip.connect(parent_sip)
+        parent_sip.connect(sie)
+        await self.run_get_response(sip.put_response_fast, sip.get_response)
+
+    async def test_uvm_item_port_custom_export(self):
+        class MyExport(uvm_export_base):
+            async def put_req(self, item):
+                pass
+
+            def put_response(self, item):
+                pass
+
+            async def get_next_item(self):
+                return "item"
+
+            def item_done(self, rsp=None):
+                pass
+
+            async def get_response(self, transaction_id=None):
+                pass
+
+        sip = uvm_seq_item_port("sip", self.my_root)
+        sip.connect(MyExport("my_export", self.my_root))
+        self.assertEqual("item", await sip.get_next_item())
+
+    async def test_uvm_item_port_not_connected(self):
+        sip = uvm_seq_item_port("sip", self.my_root)
+        with self.assertRaises(error_classes.UVMTLMConnectionError):
+            await sip.get_next_item()
+        with self.assertRaises(error_classes.UVMTLMConnectionError):
+            await sip.get_next_items()
+        with self.assertRaises(error_classes.UVMTLMConnectionError):
+            sip.item_done()
+
     async def test_premature_item_done(self):
         sip = uvm_seq_item_port("sip", self.my_root)
         sie = uvm_seq_item_export("sie", self.my_root)
@@ -174,9 +274,7 @@ class py1415_sequence_TestCase(uvm_unittest.uvm_TestCase):
 
         async def run_phase(self):
             while True:
-                next_item = await self.seq_q.get()
-                next_item.start_condition.set()
-                next_item.start_condition.clear()
+                await self.seq_item_export.req_q.get()
 
     async def seq_item_port_getter(self, sip=None):
         datum = await sip.get_next_item()
@@ -532,3 +630,51 @@ class py1415_sequence_TestCase(uvm_unittest.uvm_TestCase):
         self.assertTrue(start_return_time == finish_item_call_time)
         self.assertTrue(start_item_time + 5 == start_return_time)
         self.assertTrue(finish_item_call_time + 7 == finish_item_return_time)
+
+    async def test_get_next_items(self):
+        ObjectionHandler().run_phase_done_flag = None
+
+        class BatchSeqDriver(uvm_driver):
+            async def run_phase(self):
+                while True:
+                    await Timer(5, "ns")
+                    op_items = await self.seq_item_port.get_next_items()
+                    DataHolder().datum.append(len(op_items))
+                    for op_item in op_items:
+                        op_item.result = op_item.data + 1
+                    for _ in op_items:
+                        self.seq_item_port.item_done()
+
+        class Seq(uvm_sequence):
+            def __init__(self, name, data):
+                super().__init__(name)
+                self.data = data
+
+            async def body(self):
+                op = SeqItem("op")
+                await self.start_item(op)
+                op.data = self.data
+                await self.finish_item(op)
+                DataHolder().dict_[self.get_name()] = op.result
+
+        class SeqTest(uvm_test):
+            def build_phase(self):
+                DataHolder().datum = []
+                DataHolder().dict_ = {}
+                self.seqr = uvm_sequencer("seqr", self)
+                self.driver = BatchSeqDriver("driver", self)
+
+            def connect_phase(self):
+                self.driver.seq_item_port.connect(self.seqr.seq_item_export)
+
+            async def run_phase(self):
+                self.raise_objection()
+                seqs = [Seq("seq1", 1), Seq("seq2", 2)]
+                tasks = [cocotb.start_soon(seq.start(self.seqr)) for seq in seqs]
+                for task in tasks:
+                    await task
+                self.drop_objection()
+
+        await uvm_root().run_test("SeqTest")
+        self.assertEqual([2], DataHolder().datum)
+        self.assertEqual({"seq1": 2, "seq2": 3}, DataHolder().dict_)
@@ -0,0 +1,139 @@
+"""
+Main Packages for the entire RAL model
+"""
+
+import pytest
+
+from pyuvm.s17_uvm_reg_enumerations import uvm_status_e
+from pyuvm.s23_uvm_reg_item import uvm_reg_item
+from pyuvm.s24_uvm_reg_includes import access_e
+
+##############################################################################
+# TESTS UVM_REG_ITEM
+##############################################################################
+
+
+@pytest.mark.test_reg_item_acquire_release
+def test_reg_item_acquire_release():
+    item = uvm_reg_item.acquire("first")
+    item.set_value(5, 2)
+    item.set_offset(8)
+    item.set_status(uvm_status_e.UVM_NOT_OK)
+    item.transaction_id = 42
+    item.parent_sequence_id = 7
+    item.response_id = 99
+    item.release()
+    reused = uvm_reg_item.acquire("second")
+    assert reused is item, "Released item was not reused"
+    assert reused.name == "second"
+    assert reused.get_name() == "second"
+    assert reused.transaction_id == id(reused)
+    assert reused.parent_sequence_id is None
+    assert reused.response_id is None
+    assert reused.get_initiator() is None
+    assert reused.get_value_size() == 0
+    assert reused.get_offset() == 0
+    assert reused.get_status() == uvm_status_e.UVM_IS_OK
+    fresh = uvm_reg_item.acquire("third")
+    assert fresh is not reused, "Empty free list must construct a new item"
+
+
+@pytest.mark.test_reg_item_release_references
+def test_reg_item_release_references():
+    item = uvm_reg_item.acquire("item")
+    item.set_map("map")
+    item.set_parent_sequence("seq")
+    item.set_element("reg")
+    item.release()
+    assert item.local_map is None
+    assert item.parent_sequence is None
+    assert not hasattr(item, "element")
+    assert uvm_reg_item.acquire("reused") is item
+
+
+@pytest.mark.test_reg_item_do_copy
+def test_reg_item_do_copy():
+    item = uvm_reg_item("orig")
+    item.set_kind(access_e.UVM_WRITE)
+    item.set_value(3, 1)
+    item.set_offset(4)
+    item.set_map("map")
+    copied = item.do_copy(item)
+    assert copied is not item
+    assert copied.name == "orig"
+    assert copied.get_kind() == access_e.UVM_WRITE
+    assert list(copied.get_value_array()) == [0, 3]
+    assert copied.get_value_array() is not item.get_value_array()
+    assert copied.get_offset() == 4
+    assert copied.local_map == "map"
+    assert not hasattr(copied, "path")
+
+
+@pytest.mark.test_reg_item_do_copy_ids
+def test_reg_item_do_copy_ids():
+    item = uvm_reg_item("item")
+    item.set_name("named")
+    item.transaction_id = 42
+    item.parent_sequence_id = 7
+    item.response_id = 99
+    item.set_initiator("me")
+    copied = item.do_copy(item)
+    assert copied.get_name() == "named"
+    assert copied.name == "item"
+    assert copied.transaction_id == 42
+    assert copied.parent_sequence_id == 7
+    assert copied.response_id == 99
+    assert copied.get_initiator() == "me"
+
+
+@pytest.mark.test_reg_item_do_copy_subclass
+def test_reg_item_do_copy_subclass():
+    class MyRegItem(uvm_reg_item):
+        def __init__(self, name, tag):
+            super().__init__(name)
+            self.tag = tag
+
+    item = MyRegItem("orig", "tagged")
+    item.set_value(9)
+    copied = item.do_copy(item)
+    assert type(copied) is MyRegItem
+    assert copied.tag == "tagged"
+    assert copied.get_value(0) == 9
+
+
+@pytest.mark.test_reg_item_value
+def test_reg_item_value():
+    item = uvm_reg_item("item")
+    item.set_value(7, 3)
+    assert item.get_value_size() == 4
+    assert list(item.get_value_array()) == [0, 0, 0, 7]
+    item.set_value_size(2)
+    assert list(item.get_value_array()) == [0, 0]
+    item.set_value_array([1, 2, 3])
+    assert item.get_value(2) == 3
+    item.set_value((1 << 64) - 1)
+    assert item.get_value(0) == (1 << 64) - 1
+    # Reading the value must not change how it is stored
+    assert item.get_value_array() is item.get_value_array()
+    assert item.get_value_array().typecode == "Q"
+
+
+@pytest.mark.test_reg_item_wide_value
+def test_reg_item_wide_value():
+    item = uvm_reg_item("item")
+    item.set_value(1, 1)
+    item.set_value(1 << 64)
+    assert item.get_value(0) == 1 << 64
+    assert item.get_value(1) == 1
+    item.set_value(5, 3)
+    assert list(item.get_value_array()) == [1 << 64, 1, 0, 5]
+    copied = item.do_copy(item)
+    assert list(copied.get_value_array()) == [1 << 64, 1, 0, 5]
+    wide = [-1, 2]
+    item.set_value_array(wide)
+    assert item.get_value(0) == -1
+    assert item.get_value_array() is wide
+    item.release()
+    reused = uvm_reg_item.acquire("reused")
+    reused.set_value(3)
+    assert list(reused.get_value_array()) == [3]